@@ -1,9 +1,22 @@
 # streamlit_app.py
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import closing
+
 import requests
 import pandas as pd
 import streamlit as st
 from collections import defaultdict
 
+log = logging.getLogger(__name__)
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Page / Layout
 # ──────────────────────────────────────────────────────────────────────────────
@@ -83,48 +96,368 @@ for gw, pairs in FINAL_SCHEDULE_BY_NAME.items():
     for y_name, t_name in pairs:
         SCHEDULE[gw].append((NAME_TO_ID[y_name], NAME_TO_ID[t_name]))
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Shared cache tier (cross-worker)
+# ──────────────────────────────────────────────────────────────────────────────
+# st.cache_data is per-process, so every worker behind a load balancer would
+# fetch and build everything itself. This tier is shared between workers:
+#   H2H_CACHE_BACKEND = "sqlite" (default, file on local disk) | "memory"
+#   H2H_CACHE_PATH    = SQLite file all workers point at (its directory must be
+#                       owned by the app user and not group/world-writable)
+# If either is set explicitly and can't be used, the app refuses to start
+# rather than quietly running without the shared tier.
+CACHE_BACKEND = os.environ.get("H2H_CACHE_BACKEND", "sqlite")
+CACHE_PATH = os.environ.get(
+    "H2H_CACHE_PATH",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "h2h_fpl", "cache.sqlite3",
+    ),
+)
+POINTS_TTL = 15 * 60        # seconds a fetched/built entry stays fresh
+POINTS_L1_TTL = 60          # per-process cache in front of the shared tier
+FRESH_FOR = POINTS_TTL + POINTS_L1_TTL  # data fetched longer ago than this is a failed refresh
+REFRESH_LEASE = 30          # seconds one worker may hold a refresh lock
+STALE_GRACE = 24 * 60 * 60  # expired entries are kept this long to serve while refreshing
+LKG_TTL = 30 * 24 * 60 * 60  # last-known-good snapshots outlive any outage we care about
+FETCH_TIMEOUT = 3           # short on purpose: failures fall back to last-known-good, not 0
+FAILURE_TTL = 45            # after a failed refresh no worker retries that key for this long
+BOOTSTRAP_TTL = 5 * 60      # bootstrap-static (current GW) changes at most once per GW
+
+
+class RefreshFailed(Exception):
+    """A recent refresh of this key failed and nothing is cached; raised without retrying."""
+
+
+class SharedCache(ABC):
+    """
+    Backend interface. Subclasses store JSON-serialisable values with an expiry
+    and hand out per-key refresh leases; get_or_compute adds single-flight on top.
+    """
+
+    @abstractmethod
+    def get(self, key: str):
+        """Return (value, expires_at) or None."""
+
+    @abstractmethod
+    def set(self, key: str, value, ttl: float) -> None:
+        """Store value under key, fresh for ttl seconds."""
+
+    @abstractmethod
+    def acquire(self, key: str, lease: float):
+        """Return a token if the refresh lease for key was taken, else None."""
+
+    @abstractmethod
+    def release(self, key: str, token: str) -> None:
+        """Give up the lease if token still holds it."""
+
+    def get_or_compute(self, key: str, ttl: float, compute, lease: float = REFRESH_LEASE, poll: float = 0.2,
+                       failure_ttl: float = FAILURE_TTL):
+        """
+        Return the value for key, computing it at most once across workers.
+        On expiry only the lease holder recomputes; the others serve the stale
+        value if there is one, otherwise wait for the holder (up to the lease).
+        If the refresh fails the stale value is served too, so every worker
+        shows the same data; the error only surfaces when there is nothing to serve.
+        Failures are remembered for failure_ttl, so an outage costs one timeout
+        per key per failure_ttl rather than one per rerun.
+        """
+        deadline = time.time() + lease
+        while True:
+            hit = self.get(key)
+            if hit is not None and hit[1] > time.time():
+                return hit[0]
+            if hit is None:
+                failed = self.get(f"failed:{key}")
+                if failed is not None and failed[1] > time.time():
+                    raise RefreshFailed(failed[0])
+            token = self.acquire(key, lease)
+            if token is not None:
+                try:
+                    # Another worker may have refreshed between get() and acquire()
+                    again = self.get(key)
+                    if again is not None and again[1] > time.time():
+                        return again[0]
+                    try:
+                        value = compute()
+                    except Exception as exc:
+                        if hit is None:
+                            self.set(f"failed:{key}", f"{type(exc).__name__}: {exc}", failure_ttl)
+                            raise
+                        # Keep serving the old value; nobody retries for failure_ttl
+                        self.set(key, hit[0], failure_ttl)
+                        return hit[0]
+                    self.set(key, value, ttl)
+                    return value
+                finally:
+                    self.release(key, token)
+            if hit is not None:
+                return hit[0]
+            if time.time() > deadline:
+                # Lease holder is stuck; don't block the page on it
+                try:
+                    value = compute()
+                except Exception as exc:
+                    self.set(f"failed:{key}", f"{type(exc).__name__}: {exc}", failure_ttl)
+                    raise
+                self.set(key, value, ttl)
+                return value
+            time.sleep(poll)
+
+
+class MemoryCache(SharedCache):
+    """In-process backend (single worker, or fallback when SQLite is unusable)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._leases = {}
+
+    def get(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        with self._lock:
+            self._entries = {k: v for k, v in self._entries.items() if v[1] > now - STALE_GRACE}
+            self._entries[key] = (value, now + ttl)
+
+    def acquire(self, key, lease):
+        now = time.time()
+        with self._lock:
+            held = self._leases.get(key)
+            if held and held[1] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._leases[key] = (token, now + lease)
+            return token
+
+    def release(self, key, token):
+        with self._lock:
+            if self._leases.get(key, (None,))[0] == token:
+                del self._leases[key]
+
+
+class SqliteCache(SharedCache):
+    """
+    File-backed backend shared by every worker on the host. SQLite's file
+    locking makes set/acquire atomic across processes; WAL keeps reads cheap.
+    Values are stored as JSON so nothing in the shared file is ever executed.
+    Any SQLite error after start-up (locked, disk full) degrades to a miss, a
+    dropped write, or computing without the lease, never a crashed page.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        _ensure_private_dir(os.path.dirname(os.path.abspath(path)))
+        with closing(self._connect()) as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)")
+            con.execute("CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, token TEXT, expires_at REAL)")
+
+    def _connect(self):
+        # One short-lived connection per call: Streamlit serves sessions on threads
+        return sqlite3.connect(self.path, timeout=10, isolation_level=None)
+
+    def get(self, key):
+        try:
+            with closing(self._connect()) as con:
+                row = con.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            return json.loads(row[0]), row[1]
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        blob = json.dumps(value)
+        try:
+            with closing(self._connect()) as con:
+                con.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, blob, now + ttl),
+                )
+                con.execute("DELETE FROM entries WHERE expires_at < ?", (now - STALE_GRACE,))
+        except sqlite3.Error:
+            pass
+
+    def acquire(self, key, lease):
+        now = time.time()
+        token = uuid.uuid4().hex
+        try:
+            with closing(self._connect()) as con:
+                # Atomic: insert, or take over only if the current lease has expired
+                cur = con.execute(
+                    """
+                    INSERT INTO leases (key, token, expires_at) VALUES (?, ?, ?)
+                    ON CONFLICT(key) DO UPDATE SET token = excluded.token, expires_at = excluded.expires_at
+                    WHERE leases.expires_at <= ?
+                    """,
+                    (key, token, now + lease, now),
+                )
+                return token if cur.rowcount == 1 else None
+        except sqlite3.Error:
+            # Can't coordinate: compute without the lease rather than wait on it
+            return token
+
+    def release(self, key, token):
+        try:
+            with closing(self._connect()) as con:
+                con.execute("DELETE FROM leases WHERE key = ? AND token = ?", (key, token))
+        except sqlite3.Error:
+            pass  # lease expires on its own
+
+
+def _ensure_private_dir(path: str) -> None:
+    """Create path as 0700 if needed; refuse a directory another user could write to."""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st_dir = os.stat(path)
+    if hasattr(os, "getuid") and st_dir.st_uid != os.getuid():
+        raise PermissionError(f"cache directory {path} is not owned by this user")
+    if st_dir.st_mode & 0o022:
+        raise PermissionError(f"cache directory {path} is group/world-writable")
+
+
+@st.cache_resource(show_spinner=False)
+def shared_cache() -> SharedCache:
+    """
+    Backend selected by H2H_CACHE_BACKEND. With the defaults, an unusable SQLite
+    file logs a warning and falls back to memory (per-worker caching only);
+    with explicit settings it raises instead.
+    """
+    if CACHE_BACKEND == "memory":
+        return MemoryCache()
+    if CACHE_BACKEND != "sqlite":
+        raise ValueError(f"unknown H2H_CACHE_BACKEND {CACHE_BACKEND!r} (expected 'sqlite' or 'memory')")
+    try:
+        return SqliteCache(CACHE_PATH)
+    except (sqlite3.Error, OSError) as exc:
+        if "H2H_CACHE_BACKEND" in os.environ or "H2H_CACHE_PATH" in os.environ:
+            raise RuntimeError(f"shared cache at {CACHE_PATH} is unusable: {exc}") from exc
+        log.warning("shared cache at %s is unusable (%s); falling back to per-worker memory cache",
+                    CACHE_PATH, exc)
+        return MemoryCache()
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Data fetching (cached)
 # ──────────────────────────────────────────────────────────────────────────────
-@st.cache_data(ttl=15 * 60, show_spinner=False)
-def fetch_player_points(player_id: int) -> dict:
-    """Return {gw: points} or {} on failure."""
+# Short per-process cache in front of the shared tier, so reruns skip the disk
+@st.cache_data(ttl=POINTS_L1_TTL, show_spinner=False)
+def fetch_player_points(player_id: int, season) -> dict:
+    """
+    Return {"points": {gw: points}, "fetched_at": ts, "season": str}, fetched
+    once across workers. Raises on failure (never cached). fetched_at is when
+    the FPL API answered; the shared tier may hand back an expired entry during
+    an outage. season comes from bootstrap_info (None if unknown).
+    """
+    stored = shared_cache().get_or_compute(
+        f"points:{player_id}", POINTS_TTL, lambda: _download_player_points(player_id, season)
+    )
+    return {
+        "points": _int_keys(stored["points"]),
+        "fetched_at": stored["fetched_at"],
+        "season": stored.get("season"),
+    }
+
+def _int_keys(d: dict) -> dict:
+    """GW keys come back from the JSON cache as strings."""
+    return {int(k): v for k, v in d.items()}
+
+def same_season(tag, season) -> bool:
+    """Whether data tagged `tag` belongs to `season`; an unknown season matches anything."""
+    return season is None or tag == season
+
+def _download_player_points(player_id: int, season) -> dict:
     url = f"https://fantasy.premierleague.com/api/entry/{player_id}/history/"
-    try:
-        r = requests.get(url, timeout=6)
-        r.raise_for_status()
-        data = r.json().get("current", [])
-        return {int(ev["event"]): int(ev["points"]) for ev in data}
-    except Exception:
-        return {}
+    r = requests.get(url, timeout=FETCH_TIMEOUT)
+    r.raise_for_status()
+    data = r.json()["current"]
+    points = {int(ev["event"]): int(ev["points"]) for ev in data}
+
+    # History only grows within a season: a response missing GWs we already
+    # hold for this season is truncated. Raising keeps it out of both caches;
+    # callers fall back to older data. A new season starts from scratch.
+    known, tag = set(), season
+    for key in (f"points:{player_id}", f"lkg:{player_id}"):
+        hit = shared_cache().get(key)
+        if hit is not None and same_season(hit[0].get("season"), season):
+            known |= set(_int_keys(hit[0]["points"]))
+            tag = tag or hit[0].get("season")  # season unknown: assume it hasn't changed
+    if not known <= set(points):
+        raise ValueError(f"history for {player_id} is missing GW {sorted(known - set(points))}")
+    return {"points": points, "fetched_at": time.time(), "season": tag}
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────────────────────
-@st.cache_data(ttl=5 * 60, show_spinner=False)
-def detect_current_gw(df_player_weekly, n_gws: int) -> int:
+@st.cache_data(ttl=POINTS_L1_TTL, show_spinner=False)
+def fetch_bootstrap(n_gws: int) -> dict:
+    """{"current": gw, "season": "2025/26"} from bootstrap-static, shared across workers. Raises on failure."""
+    return shared_cache().get_or_compute(f"bootstrap:{n_gws}", BOOTSTRAP_TTL, lambda: _download_bootstrap(n_gws))
+
+def _download_bootstrap(n_gws: int) -> dict:
+    r = requests.get("https://fantasy.premierleague.com/api/bootstrap-static/", timeout=FETCH_TIMEOUT)
+    r.raise_for_status()
+    events = r.json().get("events", [])
+    # 'is_current', else latest 'is_previous'; 0 before the season
+    cur = [e["id"] for e in events if e.get("is_current")]
+    prev = [e["id"] for e in events if e.get("is_previous")]
+    if cur:
+        current = int(min(max(cur[0], 1), n_gws))
+    elif prev:
+        current = int(min(max(max(prev), 1), n_gws))
+    else:
+        current = 0
+    # Season from the first deadline, e.g. "2025-08-15T17:30:00Z" -> "2025/26"
+    season = None
+    if events and events[0].get("deadline_time"):
+        year = int(events[0]["deadline_time"][:4])
+        season = f"{year}/{(year + 1) % 100:02d}"
+    return {"current": current, "season": season}
+
+def bootstrap_info(n_gws: int):
     """
-    Prefer FPL's bootstrap-static 'is_current'. If unavailable, fall back to the
-    last GW with any points; else 1.
+    (current GW, season) per FPL; current is 0 before the season. (None, None)
+    if FPL can't be reached. Call once per run.
     """
     try:
-        r = requests.get("https://fantasy.premierleague.com/api/bootstrap-static/", timeout=6)
-        r.raise_for_status()
-        events = r.json().get("events", [])
-        cur = [e["id"] for e in events if e.get("is_current")]
-        if cur:
-            return int(min(max(cur[0], 1), n_gws))
-        prev = [e["id"] for e in events if e.get("is_previous")]
-        if prev:
-            return int(min(max(max(prev), 1), n_gws))
+        info = fetch_bootstrap(n_gws)
     except Exception:
-        pass
+        return None, None
+    return info["current"], info.get("season")
+
+def detect_current_gw(df_player_weekly, n_gws: int, current_gw) -> int:
+    """
+    Prefer FPL's bootstrap-static 'is_current' (current_gw, from bootstrap_info).
+    If unavailable, fall back to the last GW with any points; else 1.
+    """
+    if current_gw:
+        return current_gw
 
     # Fallback: last GW with any points in your data
     gw_has_points = (df_player_weekly.groupby("gameweek")["fpl_points"].sum() > 0)
     valid_gws = gw_has_points[gw_has_points].index.tolist()
     return int(min(max((max(valid_gws) if valid_gws else 1), 1), n_gws))
 
+def describe_age(ts: float) -> str:
+    """'3h ago (Sat 19 Oct, 14:05)' — snapshots can be days old, so never just a clock time."""
+    secs = max(0, time.time() - ts)
+    if secs < 60:
+        ago = "just now"
+    elif secs < 3600:
+        ago = f"{int(secs // 60)} min ago"
+    elif secs < 86400:
+        ago = f"{int(secs // 3600)}h ago"
+    else:
+        days = int(secs // 86400)
+        ago = f"{days} day{'s' if days > 1 else ''} ago"
+    return f"{ago} ({time.strftime('%a %d %b, %H:%M', time.localtime(ts))})"
+
+# Colour for scores served from a last-known-good snapshot
+STALE_COLOR = "#d97706"
+
 # Winner color resolver
 def winner_team_and_color(winner: str):
     """Return (team_name, hex_color) for the winner; neutral grey on draw/unknown."""
@@ -139,13 +472,114 @@ def winner_team_and_color(winner: str):
 # ──────────────────────────────────────────────────────────────────────────────
 # Fetch with progress, then build tables (pure)
 # ──────────────────────────────────────────────────────────────────────────────
-points = {}
+fetched = {}
 with st.status("Fetching FPL points…", expanded=False) as status:
+    current_gw, season = bootstrap_info(N_GWS)
     for pid in ALL_IDS:
-        points[pid] = fetch_player_points(pid)
-    status.update(label="Fetch complete", state="complete")
+        try:
+            fetched[pid] = fetch_player_points(pid, season)
+        except Exception:
+            pass  # handled by validate_points
+    n_failed = len(ALL_IDS) - len(fetched)
+    if n_failed:
+        status.update(label=f"Fetch complete — {n_failed} manager(s) unavailable", state="error")
+    else:
+        status.update(label="Fetch complete", state="complete")
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Validation: freshness & completeness per manager
+# ──────────────────────────────────────────────────────────────────────────────
+def validate_points(fetched: dict, current_gw, season):
+    """
+    Sit between fetching and build_tables so a failed fetch never reads as a
+    0-point gameweek. `fetched` holds fetch_player_points results for managers
+    whose fetch succeeded. Every manager should cover GW 1..latest (latest =
+    newest GW seen anywhere); gaps are filled from the last-known-good snapshot,
+    and what the snapshot can't cover is marked missing. A manager with no data
+    at all is missing every GW up to current_gw (per bootstrap-static; None
+    means unreachable, and then the whole schedule counts). Data tagged with
+    another season than `season` (a new season has started) is ignored. Data fetched more than
+    FRESH_FOR ago (an expired shared entry served during an outage) means the
+    refresh failed, exactly like a fetch that raised.
+
+    Returns (points, quality) where quality[pid] has:
+      status      "fresh"      - fetched within FRESH_FOR and complete
+                  "incomplete" - fetched within FRESH_FOR but the response is short
+                  "stale"      - refresh failed; showing older data
+                  "missing"    - refresh failed and there is no older data
+      as_of       fetch time of the oldest data shown when not fresh, else None
+      stale_gws   GWs served from older data
+      missing_gws GWs with no usable data
+    """
+    cache = shared_cache()
+    snapshots = {}
+    for pid in ALL_IDS:
+        hit = cache.get(f"lkg:{pid}")
+        if hit is not None and same_season(hit[0].get("season"), season):
+            snapshots[pid] = {
+                "points": _int_keys(hit[0]["points"]),
+                "as_of": hit[0]["as_of"],
+                "season": hit[0].get("season"),
+            }
+    # An expired entry from last season served during an outage is no data at all
+    fetched = {pid: e for pid, e in fetched.items() if same_season(e["season"], season)}
+
+    seen = [gw for entry in fetched.values() for gw in entry["points"]]
+    seen += [gw for snap in snapshots.values() for gw in snap["points"]]
+    latest = min(max(seen, default=0), N_GWS)
+    expected = set(range(1, latest + 1))
+    # Horizon for managers with nothing at all; an empty `seen` must not mean "no GWs"
+    no_data_expected = set(range(1, max(latest, N_GWS if current_gw is None else current_gw) + 1))
+
+    now = time.time()
+    points, quality = {}, {}
+    for pid in ALL_IDS:
+        entry = fetched.get(pid)
+        snap = snapshots.get(pid)
+        got = entry["points"] if entry else {}
+        fresh = entry is not None and now - entry["fetched_at"] <= FRESH_FOR
+        complete = entry is not None and expected <= set(got)
+        # Write only when this fetch is newer than the snapshot (once per fetch, not per rerun)
+        if complete and (snap is None or entry["fetched_at"] > snap["as_of"]):
+            cache.set(
+                f"lkg:{pid}", {"points": got, "as_of": entry["fetched_at"], "season": entry["season"]}, LKG_TTL
+            )
+        if fresh and complete:
+            points[pid] = got
+            quality[pid] = {"status": "fresh", "as_of": None, "stale_gws": [], "missing_gws": []}
+            continue
+
+        merged = dict(got)
+        snap_pts = snap["points"] if snap else {}
+        filled = sorted(gw for gw in expected - set(merged) if gw in snap_pts)
+        merged.update({gw: snap_pts[gw] for gw in filled})
+        missing = sorted((expected if merged else no_data_expected) - set(merged))
+        times = [snap["as_of"]] if filled else []
+        if fresh:
+            # A real, recent response that is short; only the filled GWs are old
+            status, stale = "incomplete", filled
+        else:
+            # Failed refresh: everything shown is older data
+            if entry is not None:
+                times.append(entry["fetched_at"])
+            status = "stale" if merged else "missing"
+            stale = sorted(set(merged) & expected)
+        points[pid] = merged
+        quality[pid] = {
+            "status": status,
+            "as_of": min(times) if times else None,
+            "stale_gws": stale,
+            "missing_gws": missing,
+        }
+    return points, quality
+
+points, quality = validate_points(fetched, current_gw, season)
+
+def build_tables(points_dict: dict, quality: dict = None):
+    quality = quality or {}
+    stale = {(pid, gw) for pid, q in quality.items() for gw in q["stale_gws"]}
+    missing = {(pid, gw) for pid, q in quality.items() for gw in q["missing_gws"]}
 
-def build_tables(points_dict: dict):
     # Player weekly
     rows_weeks = []
     for gw in range(1, N_GWS + 1):
@@ -155,7 +589,10 @@ def build_tables(points_dict: dict):
                 "player_id": pid,
                 "player_name": NAMES[pid],
                 "team": PLAYER_TO_TEAM[pid],
-                "fpl_points": points_dict.get(pid, {}).get(gw, 0),
+                # No data is NaN, not 0, so it never counts towards a total
+                "fpl_points": None if (pid, gw) in missing else points_dict.get(pid, {}).get(gw, 0),
+                "stale": (pid, gw) in stale,
+                "missing": (pid, gw) in missing,
             })
     df_player_weekly = pd.DataFrame(rows_weeks)
 
@@ -165,7 +602,10 @@ def build_tables(points_dict: dict):
         for y_id, t_id in pairs:
             y_pts = points_dict.get(y_id, {}).get(gw, 0)
             t_pts = points_dict.get(t_id, {}).get(gw, 0)
-            if y_pts > t_pts:
+            if (y_id, gw) in missing or (t_id, gw) in missing:
+                # Unknown result: award nothing rather than a win against a fake 0
+                y_mp, t_mp, winner = 0, 0, "—"
+            elif y_pts > t_pts:
                 y_mp, t_mp, winner = 1, 0, NAMES[y_id]
             elif t_pts > y_pts:
                 y_mp, t_mp, winner = 0, 1, NAMES[t_id]
@@ -178,6 +618,8 @@ def build_tables(points_dict: dict):
                 "think_id": t_id, "think_name": NAMES[t_id], "think_team": TEAM_GEESE,
                 "think_score": t_pts, "think_match_point": t_mp,
                 "winner": winner,
+                "young_stale": (y_id, gw) in stale, "young_missing": (y_id, gw) in missing,
+                "think_stale": (t_id, gw) in stale, "think_missing": (t_id, gw) in missing,
             })
     df_fixtures = pd.DataFrame(match_rows).sort_values(["gameweek", "young_name"])
 
@@ -193,15 +635,18 @@ def build_tables(points_dict: dict):
             "player_name": NAMES[pid],
             "team": PLAYER_TO_TEAM[pid],
             "wins": wins,
-            "total_fpl_points": int(df_player_weekly.loc[df_player_weekly.player_id == pid, "fpl_points"].sum())
+            "total_fpl_points": int(df_player_weekly.loc[df_player_weekly.player_id == pid, "fpl_points"].sum()),
+            # Total leaves out GWs with no data
+            "partial": bool(df_player_weekly.loc[df_player_weekly.player_id == pid, "missing"].any()),
         })
     df_player_summary = pd.DataFrame(player_rows).sort_values(["wins", "total_fpl_points"], ascending=[False, False])
 
     # Team weekly (FPL + match points)
     team_rows = []
     for gw in range(1, N_GWS + 1):
-        geese_fpl = int(df_player_weekly.query("gameweek==@gw and team==@TEAM_GEESE")["fpl_points"].sum())
-        bbb_fpl  = int(df_player_weekly.query("gameweek==@gw and team==@TEAM_BBBSAS")["fpl_points"].sum())
+        # min_count: a team GW with any manager missing is NaN rather than an undercount
+        geese_fpl = df_player_weekly.query("gameweek==@gw and team==@TEAM_GEESE")["fpl_points"].sum(min_count=len(THINK_TANK))
+        bbb_fpl  = df_player_weekly.query("gameweek==@gw and team==@TEAM_BBBSAS")["fpl_points"].sum(min_count=len(YOUNGSTERS))
         geese_mp = int(df_fixtures.loc[df_fixtures.gameweek == gw, "think_match_point"].sum())
         bbb_mp   = int(df_fixtures.loc[df_fixtures.gameweek == gw, "young_match_point"].sum())
         team_rows += [
@@ -219,10 +664,48 @@ def build_tables(points_dict: dict):
 
     return df_player_weekly, df_fixtures, df_player_summary, df_team_weekly, df_team_scoreboard
 
-df_player_weekly, df_fixtures, df_player_summary, df_team_weekly, df_team_scoreboard = build_tables(points)
-
-# Detect pre-season
-pre_season = (df_player_weekly["fpl_points"].sum() == 0)
+def build_tables_shared(points_dict: dict, quality: dict):
+    """build_tables, computed once per distinct points snapshot across workers."""
+    cells = {pid: (q["stale_gws"], q["missing_gws"]) for pid, q in quality.items()}
+    digest = hashlib.sha1(json.dumps([points_dict, cells], sort_keys=True).encode()).hexdigest()
+    # Frames go through the cache as JSON: "split" keeps index and columns, but
+    # pandas re-infers types from the rows, so dtypes are stored and restored too
+    stored = shared_cache().get_or_compute(
+        f"tables:v2:{digest}", POINTS_TTL,
+        lambda: [
+            {"frame": json.loads(df.to_json(orient="split")), "dtypes": df.dtypes.astype(str).to_dict()}
+            for df in build_tables(points_dict, quality)
+        ],
+    )
+    return tuple(pd.DataFrame(**t["frame"]).astype(t["dtypes"]) for t in stored)
+
+df_player_weekly, df_fixtures, df_player_summary, df_team_weekly, df_team_scoreboard = build_tables_shared(points, quality)
+
+# Data-quality banner: which managers aren't showing live numbers
+degraded = {pid: q for pid, q in quality.items() if q["status"] != "fresh"}
+if degraded:
+    lines = []
+    for pid, q in degraded.items():
+        as_of = describe_age(q["as_of"]) if q["as_of"] else None
+        stale_gws = ", ".join(str(gw) for gw in q["stale_gws"])
+        missing_gws = ", ".join(str(gw) for gw in q["missing_gws"])
+        if q["status"] == "missing":
+            line = f"- **{NAMES[pid]}**: couldn’t refresh and no earlier data — results pending"
+        elif q["status"] == "stale":
+            line = f"- **{NAMES[pid]}**: couldn’t refresh — showing data fetched {as_of}"
+            if missing_gws:
+                line += f"; no data for GW {missing_gws}"
+        else:
+            line = f"- **{NAMES[pid]}**: incomplete response"
+            if stale_gws:
+                line += f" — GW {stale_gws} from data fetched {as_of}"
+            if missing_gws:
+                line += f"; no data for GW {missing_gws}"
+        lines.append(line)
+    st.warning("Some managers couldn’t be refreshed; affected scores are flagged.\n\n" + "\n".join(lines))
+
+# Detect pre-season (only trust all-zero points when every manager was fetched)
+pre_season = (df_player_weekly["fpl_points"].sum() == 0) and not degraded
 if pre_season:
     st.info("Season hasn’t started yet — showing schedule and a 0–0 scoreboard.")
 
@@ -277,7 +760,7 @@ if page == "Dashboard":
     # ── Gameweek Matches — compact cards with per-player links for selected GW
     st.divider()
     st.subheader("Gameweek Matches")
-    default_gw = detect_current_gw(df_player_weekly, N_GWS)
+    default_gw = detect_current_gw(df_player_weekly, N_GWS, current_gw)
     sel_gw = st.slider("Gameweek", min_value=1, max_value=N_GWS, value=default_gw, step=1)
     gw_df = df_fixtures[df_fixtures.gameweek == sel_gw].copy()
 
@@ -286,10 +769,21 @@ if page == "Dashboard":
         gw_df["young_score"] = "—"
         gw_df["think_score"] = "—"
         gw_df["winner"] = "—"
+    else:
+        # Unknown scores are shown as dashes, never as 0
+        gw_df["young_score"] = gw_df["young_score"].mask(gw_df.young_missing, "—")
+        gw_df["think_score"] = gw_df["think_score"].mask(gw_df.think_missing, "—")
 
     cols = st.columns(3)
 
-    def mini_match_card(young_name, young_id, y_score, think_name, think_id, t_score, winner, gw_num):
+    def score_note(stale):
+        """Small caption under a score that came from the last-known-good snapshot."""
+        if not stale:
+            return ""
+        return f"""<div style="font-size:11px; font-weight:600; color:{STALE_COLOR};">last known</div>"""
+
+    def mini_match_card(young_name, young_id, y_score, think_name, think_id, t_score, winner, gw_num,
+                        y_stale=False, t_stale=False):
         team, color = winner_team_and_color(winner)
         # Dynamic per-player GW links
         y_url = f"https://fantasy.premierleague.com/entry/{young_id}/event/{gw_num}"
@@ -322,6 +816,7 @@ if page == "Dashboard":
                         </a>
                     </div>
                     <div style="font-size:28px; font-weight:800; margin-top:4px; color:#111827; text-align:left;">{y_score}</div>
+                    {score_note(y_stale)}
                 </div>
                 <div style="width:34px; text-align:center; font-weight:700; color:#6b7280">vs</div>
                 <div style="flex:1; text-align:right;">
@@ -331,6 +826,7 @@ if page == "Dashboard":
                         </a>
                     </div>
                     <div style="font-size:28px; font-weight:800; margin-top:4px; color:#111827; text-align:right;">{t_score}</div>
+                    {score_note(t_stale)}
                 </div>
             </div>
             <div style="margin-top:10px; font-size:12px; color:#6b7280;">
@@ -344,7 +840,8 @@ if page == "Dashboard":
             mini_match_card(
                 row["young_name"], row["young_id"], row["young_score"],
                 row["think_name"], row["think_id"], row["think_score"],
-                row["winner"], sel_gw
+                row["winner"], sel_gw,
+                y_stale=row["young_stale"], t_stale=row["think_stale"],
             ),
             unsafe_allow_html=True
         )
@@ -362,7 +859,16 @@ if page == "Dashboard":
         "wins": "Wins",
         "total_fpl_points": "Total FPL Points",
     })
-    st.dataframe(center_df(ranked_view), use_container_width=True)
+
+    # Flag totals that leave out GWs with no data
+    def partial_styles(frame):
+        styles = pd.DataFrame("", index=frame.index, columns=frame.columns)
+        styles.loc[df_ranked.partial, "Total FPL Points"] = f"color: {STALE_COLOR}; font-weight: 700"
+        return styles
+
+    st.dataframe(center_df(ranked_view).apply(partial_styles, axis=None), use_container_width=True)
+    if df_ranked.partial.any():
+        st.caption("Orange totals are partial — they leave out gameweeks with no data yet.")
 
 # ──────────────────────────────────────────────────────────────────────────────
 # ALL GAMES
@@ -388,4 +894,18 @@ else:
             tidy[c] = tidy[c].apply(lambda v: "—" if isinstance(v, int) and v == 0 else v)
         tidy["Winner"] = "—"
 
-    st.dataframe(center_df(tidy), use_container_width=True)
+    # Flag cells that didn't come from a fresh fetch
+    y_col, t_col = f"{TEAM_BBBSAS} score", f"{TEAM_GEESE} score"
+    flags = df_fixtures.loc[tidy.index]
+    tidy[y_col] = tidy[y_col].mask(flags.young_missing, "—")
+    tidy[t_col] = tidy[t_col].mask(flags.think_missing, "—")
+
+    def stale_styles(frame):
+        styles = pd.DataFrame("", index=frame.index, columns=frame.columns)
+        styles.loc[flags.young_stale, y_col] = f"color: {STALE_COLOR}; font-weight: 700"
+        styles.loc[flags.think_stale, t_col] = f"color: {STALE_COLOR}; font-weight: 700"
+        return styles
+
+    st.dataframe(center_df(tidy).apply(stale_styles, axis=None), use_container_width=True)
+    if flags[["young_stale", "think_stale"]].any().any():
+        st.caption("Orange scores are from the last-known-good snapshot; “—” means no data yet.")